@@ -1,11 +1,23 @@
 import streamlit as st
 import requests
 import datetime
+import time
 
 # from exception.exceptions import TradingBotException
 import sys
 
 BASE_URL = "http://localhost:8000"  # Backend endpoint
+# (connect, read) seconds; reads cover an LLM call plus the SQL query
+REQUEST_TIMEOUT = (10, 300)
+
+
+def get_http_session():
+    # One session per user so their reruns reuse keep-alive connections
+    # without sharing cookies or a non-thread-safe Session across users
+    if "http_session" not in st.session_state:
+        st.session_state.http_session = requests.Session()
+    return st.session_state.http_session
+
 
 st.set_page_config(
     page_title="🔫 AI Powered SQL Dashboard",
@@ -34,13 +46,18 @@ if submit_button and user_input.strip():
         # Show thinking spinner while backend processes
         with st.spinner("Bot is thinking..."):
             payload = {"question": user_input}
-            response = requests.post(f"{BASE_URL}/query", json=payload)
+            started = time.perf_counter()
+            response = get_http_session().post(
+                f"{BASE_URL}/query", json=payload, timeout=REQUEST_TIMEOUT
+            )
+            elapsed_ms = (time.perf_counter() - started) * 1000
 
         if response.status_code == 200:
             answer = response.json().get("answer", "No answer returned.")
             markdown_content = f"""# 🌍 AI Powered SQL Dashboard
 
             # **Generated:** {datetime.datetime.now().strftime('%Y-%m-%d at %H:%M')}  
+            # **Response time:** {elapsed_ms:.0f} ms  
             # **Created by:** Madhur's Travel Agent
 
             ---
@@ -55,6 +72,9 @@ if submit_button and user_input.strip():
         else:
             st.error(" Bot failed to respond: " + response.text)
 
+    except requests.RequestException as e:
+        st.error(f" Bot failed to respond: {e}")
+
     except Exception as e:
         raise f"The response failed due to {e}"
     
\ No newline at end of file